@@ -15,8 +15,9 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.config import Config, load_config, save_config, get_default_config_path
-from src.processor import QAExtractionProcessor
-from src.utils import setup_logger
+
+# QAExtractionProcessor is imported lazily in main(): it pulls in PyMuPDF,
+# ollama and tqdm, which would slow down --help/--create-config/--version.
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -227,7 +228,7 @@ def load_and_merge_config(args: argparse.Namespace) -> Config:
     return config
 
 
-def validate_setup(processor: QAExtractionProcessor) -> bool:
+def validate_setup(processor: "QAExtractionProcessor") -> bool:
     """Validate the setup and print results."""
     print("🔍 Validating setup...")
     
@@ -309,7 +310,10 @@ def main():
     # Validate required arguments
     if not args.validate and not args.pdf_file:
         parser.error("PDF file is required unless using --validate or --create-config")
-    
+
+    # Import here so that help/config-only invocations stay fast
+    from src.processor import QAExtractionProcessor
+
     # Initialize processor
     try:
         processor = QAExtractionProcessor(config)
@@ -1,10 +1,50 @@
 """Configuration settings for Legend QA Extractor."""
 
+import copy
+import logging
 import os
 import yaml
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+
+try:
+    # C-accelerated loader/dumper are ~10x faster when libyaml is available
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+logger = logging.getLogger(__name__)
+
+# Default Q&A prefixes shared by all Config instances; copied into a list
+# per instance since known_prefixes is a mutable, user-overridable field
+_DEFAULT_KNOWN_PREFIXES = (
+    "网友", "记者", "问", "提问者", "主持人",
+    "文章引用", "Q", "观众", "评论", "主持", "用户"
+)
+
+# Parsed YAML keyed by path; entries are invalidated by file mtime so edits
+# are picked up while repeated startup loads skip the file I/O and parse
+_yaml_cache: Dict[str, Tuple[float, dict]] = {}
+
+
+def _parse_bool(value: str) -> bool:
+    """Interpret a config/env string as a boolean flag."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Env-override type conversion as a single dict lookup; attrs not listed
+# here stay strings
+_ENV_CONVERTERS = {
+    'temperature': float,
+    'extract_ratio': float,
+    'max_block_size': int,
+    'min_block_size': int,
+    'parallel_requests': int,
+    'enable_qa_filter': _parse_bool,
+    'use_intelligent_segmentation': _parse_bool,
+    'enable_text_cache': _parse_bool,
+}
 
 
 @dataclass
@@ -20,6 +60,7 @@ class Config:
     model_name: str = "qwen2.5:7b-instruct"
     ollama_host: str = "http://localhost:11434"
     temperature: float = 0.1
+    parallel_requests: int = 4  # Concurrent in-flight Ollama requests
     
     # Text processing
     max_block_size: int = 1500
@@ -27,6 +68,10 @@ class Config:
     extract_ratio: float = 1.0
     use_intelligent_segmentation: bool = True  # Use intelligent segmentation by default
     
+    # Caching
+    enable_text_cache: bool = True  # Reuse extracted PDF text across runs
+    llm_cache_path: Optional[str] = None  # Persist LLM responses across runs when set
+
     # QA filtering
     enable_qa_filter: bool = False
     known_prefixes: List[str] = None
@@ -38,10 +83,45 @@ class Config:
     
     def __post_init__(self):
         if self.known_prefixes is None:
-            self.known_prefixes = [
-                "网友", "记者", "问", "提问者", "主持人", 
-                "文章引用", "Q", "观众", "评论", "主持", "用户"
-            ]
+            self.known_prefixes = list(_DEFAULT_KNOWN_PREFIXES)
+
+
+def _load_yaml_cached(config_path: str) -> Optional[dict]:
+    """Parse a YAML config file, reusing the cached result while unchanged.
+
+    A file that fails to parse is treated like a missing one: load_config
+    is documented (and tested) not to raise on a malformed config, so the
+    error is logged loudly and the caller falls back to defaults plus
+    environment overrides.
+
+    Args:
+        config_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML mapping, or None if the file is empty or invalid
+    """
+    mtime = os.path.getmtime(config_path)
+    cached = _yaml_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        # Deep-copied so callers never alias the cached mapping: mutable
+        # values (e.g. known_prefixes) end up attached to Config objects,
+        # and mutating one load must not pollute later loads
+        return copy.deepcopy(cached[1])
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            yaml_config = yaml.load(f, Loader=_YamlLoader)
+    except yaml.YAMLError as e:
+        logger.error(
+            f"Invalid YAML in {config_path}; ignoring the file and using "
+            f"default settings: {e}"
+        )
+        yaml_config = None
+
+    _yaml_cache[config_path] = (mtime, yaml_config)
+    # The freshly parsed mapping is cached pristine; hand the caller a copy
+    # for the same no-aliasing guarantee as the cache-hit path
+    return copy.deepcopy(yaml_config)
 
 
 def load_config(config_path: Optional[str] = None) -> Config:
@@ -57,12 +137,11 @@ def load_config(config_path: Optional[str] = None) -> Config:
     
     # Load from YAML file if provided
     if config_path and os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            yaml_config = yaml.safe_load(f)
-            if yaml_config:
-                for key, value in yaml_config.items():
-                    if hasattr(config, key):
-                        setattr(config, key, value)
+        yaml_config = _load_yaml_cached(config_path)
+        if yaml_config:
+            for key, value in yaml_config.items():
+                if hasattr(config, key):
+                    setattr(config, key, value)
     
     # Override with environment variables
     env_mappings = {
@@ -72,26 +151,31 @@ def load_config(config_path: Optional[str] = None) -> Config:
         'OLLAMA_MODEL': 'model_name',
         'OLLAMA_HOST': 'ollama_host',
         'MODEL_TEMPERATURE': 'temperature',
+        'PARALLEL_REQUESTS': 'parallel_requests',
         'MAX_BLOCK_SIZE': 'max_block_size',
         'MIN_BLOCK_SIZE': 'min_block_size',
         'EXTRACT_RATIO': 'extract_ratio',
         'USE_INTELLIGENT_SEGMENTATION': 'use_intelligent_segmentation',
+        'ENABLE_TEXT_CACHE': 'enable_text_cache',
+        'LLM_CACHE_PATH': 'llm_cache_path',
         'ENABLE_QA_FILTER': 'enable_qa_filter',
         'LOG_LEVEL': 'log_level',
     }
     
+    # One snapshot of the environment mapping instead of a getenv call
+    # (and its per-lookup scan) for every entry
+    env = os.environ
     for env_var, config_attr in env_mappings.items():
-        env_value = os.getenv(env_var)
-        if env_value is not None:
-            # Type conversion
-            if config_attr in ['temperature', 'extract_ratio']:
-                env_value = float(env_value)
-            elif config_attr in ['max_block_size', 'min_block_size']:
-                env_value = int(env_value)
-            elif config_attr in ['enable_qa_filter', 'use_intelligent_segmentation']:
-                env_value = env_value.lower() in ('true', '1', 'yes', 'on')
-            
-            setattr(config, config_attr, env_value)
+        env_value = env.get(env_var)
+        if env_value is None:
+            continue
+
+        # Type conversion
+        converter = _ENV_CONVERTERS.get(config_attr)
+        if converter is not None:
+            env_value = converter(env_value)
+
+        setattr(config, config_attr, env_value)
     
     return config
 
@@ -109,7 +193,10 @@ def save_config(config: Config, config_path: str) -> None:
     Path(config_path).parent.mkdir(parents=True, exist_ok=True)
     
     with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config_dict, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(config_dict, f, Dumper=_YamlDumper,
+                  default_flow_style=False, allow_unicode=True)
+    # The file just changed on disk; drop any stale parse
+    _yaml_cache.pop(config_path, None)
 
 
 def get_default_config_path() -> str:
@@ -5,4 +5,14 @@ from .text_processor import TextProcessor
 from .qa_extractor import QAExtractor
 from .llm_client import LLMClient
 
-__all__ = ["PDFProcessor", "TextProcessor", "QAExtractor", "LLMClient"] 
\ No newline at end of file
+__all__ = ["PDFProcessor", "TextProcessor", "QAExtractor", "QAEvaluator", "LLMClient"]
+
+
+def __getattr__(name):
+    # QAEvaluator pulls in sentence-transformers/torch when the eval extra
+    # is installed, a multi-second import the extraction pipeline never
+    # needs — so it is resolved on first attribute access instead of here
+    if name == "QAEvaluator":
+        from .qa_evaluator import QAEvaluator
+        return QAEvaluator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,11 @@
 """LLM client module for interacting with Ollama models."""
 
-from typing import Optional, Dict, Any
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Dict, Any
 import logging
 from ollama import Client
 
@@ -10,65 +15,228 @@ logger = logging.getLogger(__name__)
 class LLMClient:
     """Client for interacting with Ollama LLM models."""
     
-    def __init__(self, host: str = "http://localhost:11434", model_name: str = "qwen2.5:7b-instruct"):
+    def __init__(self, host: str = "http://localhost:11434", model_name: str = "qwen2.5:7b-instruct",
+                 enable_response_cache: bool = True, keep_alive: str = "10m",
+                 cache_path: Optional[str] = None):
         self.host = host
         self.model_name = model_name
+        # One Client per LLMClient: the underlying httpx session is
+        # thread-safe and reuses its keep-alive connection pool across all
+        # concurrent workers, so no per-request TCP handshakes occur
         self.client = Client(host=host)
         self.logger = logger
-        
-        # Test connection
-        self._test_connection()
+        self.enable_response_cache = enable_response_cache
+        self.keep_alive = keep_alive
+        self._response_cache: Dict[str, str] = {}
+        # Optional on-disk cache so responses survive process restarts;
+        # reruns during tuning then skip inference entirely
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._cache_db_lock = threading.Lock()
+        if cache_path and enable_response_cache:
+            self._open_cache_db(cache_path)
+        # client.list() is an HTTP roundtrip and the local model set rarely
+        # changes, so the result is cached briefly and invalidated on
+        # pull_model/set_model
+        self._models_cache: Optional[List[Dict[str, Any]]] = None
+        self._models_cache_ts = 0.0
+        self._model_names: frozenset = frozenset()
+
+        # The connection is probed lazily: validate_setup (and the first
+        # model-list consumer) calls _test_connection, so constructing a
+        # client costs no HTTP round-trip
     
+    def _open_cache_db(self, cache_path: str) -> None:
+        """Open (or create) the persistent response-cache database.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+        """
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            db = sqlite3.connect(cache_path, check_same_thread=False)
+            # WAL keeps concurrent reads cheap; NORMAL sync is plenty for a
+            # cache that can always be regenerated
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            db.commit()
+            self._cache_db = db
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to open LLM cache {cache_path}: {e}")
+            self._cache_db = None
+
+    def _cache_db_get(self, cache_key: str) -> Optional[str]:
+        """Look up a cached response on disk.
+
+        Args:
+            cache_key: Response cache key
+
+        Returns:
+            Cached response text or None on miss/error
+        """
+        try:
+            with self._cache_db_lock:
+                row = self._cache_db.execute(
+                    "SELECT response FROM response_cache WHERE key = ?",
+                    (cache_key,)
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            self.logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def _cache_db_put(self, cache_key: str, response: str) -> None:
+        """Store a response in the on-disk cache.
+
+        Args:
+            cache_key: Response cache key
+            response: Response text to store
+        """
+        try:
+            with self._cache_db_lock:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, response) VALUES (?, ?)",
+                    (cache_key, response)
+                )
+                self._cache_db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"LLM cache write failed: {e}")
+
     def _test_connection(self) -> bool:
         """Test connection to Ollama server.
-        
+
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            # Try to list models to test connection
-            models = self.client.list()
+            # Try to list models to test connection (also primes the cache)
+            model_list = self._get_models(max_age=0.0)
             self.logger.info(f"Successfully connected to Ollama at {self.host}")
-            model_list = models.get('models', []) if isinstance(models, dict) else []
             model_names = [m.get('name', 'unknown') for m in model_list if isinstance(m, dict)]
             self.logger.info(f"Available models: {model_names}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to Ollama at {self.host}: {e}")
             return False
+
+    def _get_models(self, max_age: float = 30.0) -> List[Dict[str, Any]]:
+        """Return the server's model list, cached for a short TTL.
+
+        Args:
+            max_age: Maximum cache age in seconds; 0 forces a refresh
+
+        Returns:
+            List of model dictionaries from the Ollama server
+        """
+        now = time.monotonic()
+        if (self._models_cache is not None
+                and now - self._models_cache_ts < max_age):
+            return self._models_cache
+
+        models = self.client.list()
+        model_list = models.get('models', []) if isinstance(models, dict) else []
+        self._models_cache = model_list
+        self._models_cache_ts = now
+        # Name set is derived once per refresh so availability checks are
+        # O(1) lookups with no per-call list building
+        self._model_names = frozenset(
+            m.get('name', 'unknown') for m in model_list if isinstance(m, dict)
+        )
+        return model_list
     
-    def call_ollama(self, prompt: str, temperature: float = 0.1, **kwargs) -> Optional[str]:
+    def call_ollama(self, prompt: str, temperature: float = 0.1,
+                    system: Optional[str] = None,
+                    response_format: Optional[str] = None, **kwargs) -> Optional[str]:
         """Call Ollama model with given prompt.
-        
+
         Args:
             prompt: Input prompt for the model
             temperature: Model temperature for response generation
+            system: Static system instructions sent ahead of the prompt;
+                keeping the invariant text in a byte-identical leading message
+                lets the server reuse its KV prefix across calls
+            response_format: Ollama format constraint (e.g. "json") to restrict
+                generated tokens; None leaves output unconstrained
             **kwargs: Additional options for the model
-            
+
         Returns:
             Model response text or None if failed
         """
+        cache_key = None
+        if self.enable_response_cache:
+            cache_key = self._cache_key(prompt, temperature, kwargs, response_format, system)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Returning cached Ollama response")
+                return cached
+            if self._cache_db is not None:
+                cached = self._cache_db_get(cache_key)
+                if cached is not None:
+                    self.logger.debug("Returning persisted Ollama response")
+                    self._response_cache[cache_key] = cached
+                    return cached
+
         try:
             options = {
                 "temperature": temperature,
                 **kwargs
             }
-            
+
+            chat_kwargs = {}
+            if response_format is not None:
+                chat_kwargs['format'] = response_format
+
+            messages = []
+            if system is not None:
+                messages.append({"role": "system", "content": system})
+            messages.append({"role": "user", "content": prompt})
+
             response = self.client.chat(
                 model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                options=options
+                messages=messages,
+                options=options,
+                keep_alive=self.keep_alive,
+                **chat_kwargs
             )
-            
+
             if response and "message" in response and "content" in response["message"]:
-                return response["message"]["content"]
+                content = response["message"]["content"]
+                if cache_key is not None:
+                    self._response_cache[cache_key] = content
+                    if self._cache_db is not None:
+                        self._cache_db_put(cache_key, content)
+                return content
             else:
                 self.logger.warning("Unexpected response format from Ollama")
                 return None
-                
+
         except Exception as e:
             self.logger.error(f"Ollama API call failed: {e}")
             return None
+
+    def _cache_key(self, prompt: str, temperature: float, options: Dict[str, Any],
+                   response_format: Optional[str] = None,
+                   system: Optional[str] = None) -> str:
+        """Build a cache key covering everything that shapes the response.
+
+        Args:
+            prompt: Input prompt
+            temperature: Model temperature
+            options: Additional model options
+            response_format: Ollama format constraint, if any
+            system: System instructions, if any
+
+        Returns:
+            Hex digest key for the response cache
+        """
+        raw = (f"{self.model_name}|{temperature}|{response_format}|"
+               f"{sorted(options.items())}|{system}|{prompt}")
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
     
     def get_model_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the current model.
@@ -77,9 +245,7 @@ class LLMClient:
             Model information dictionary or None if failed
         """
         try:
-            models = self.client.list()
-            model_list = models.get('models', []) if isinstance(models, dict) else []
-            for model in model_list:
+            for model in self._get_models():
                 if isinstance(model, dict) and model.get('name') == self.model_name:
                     return model
             return None
@@ -94,13 +260,11 @@ class LLMClient:
             True if model is available, False otherwise
         """
         try:
-            models = self.client.list()
-            model_list = models.get('models', []) if isinstance(models, dict) else []
-            model_names = [m.get('name', 'unknown') for m in model_list if isinstance(m, dict)]
-            available = self.model_name in model_names
-            
+            self._get_models()
+            available = self.model_name in self._model_names
+
             if not available:
-                self.logger.warning(f"Model {self.model_name} not found. Available models: {model_names}")
+                self.logger.warning(f"Model {self.model_name} not found. Available models: {sorted(self._model_names)}")
             
             return available
         except Exception as e:
@@ -116,6 +280,7 @@ class LLMClient:
         try:
             self.logger.info(f"Pulling model {self.model_name}...")
             self.client.pull(self.model_name)
+            self._models_cache = None  # Model set changed
             self.logger.info(f"Successfully pulled model {self.model_name}")
             return True
         except Exception as e:
@@ -1,11 +1,20 @@
 """PDF processing module for extracting text from PDF documents."""
 
+import os
+
 import fitz  # PyMuPDF
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared translation table for flattening intra-paragraph whitespace
+_NL_TO_SPACE = str.maketrans('\n\r\t', '   ')
+
+# Text-only extraction: dropping TEXT_PRESERVE_IMAGES keeps MuPDF from
+# decoding and emitting image blocks we would discard anyway
+_BLOCK_FLAGS = fitz.TEXTFLAGS_BLOCKS & ~fitz.TEXT_PRESERVE_IMAGES
+
 
 class PDFProcessor:
     """Handles PDF text extraction and processing."""
@@ -27,32 +36,44 @@ class PDFProcessor:
             Exception: If PDF processing fails
         """
         try:
-            doc = fitz.open(pdf_path)
-            all_paragraphs = []
-            
-            for page_num, page in enumerate(doc):
-                try:
-                    blocks = page.get_text("blocks")
-                    for block in blocks:
-                        paragraph_text = block[4].replace('\n', ' ').strip()
-                        if paragraph_text:
-                            all_paragraphs.append(paragraph_text)
-                except Exception as e:
-                    self.logger.warning(f"Error processing page {page_num + 1}: {e}")
-                    continue
-            
-            doc.close()
-            extracted_text = "\n\n".join(all_paragraphs)
-            
+            extracted_text = "\n\n".join(self.iter_paragraphs(pdf_path))
+
             self.logger.info(f"Successfully extracted {len(extracted_text)} characters from PDF")
             return extracted_text
-            
+
         except FileNotFoundError:
             self.logger.error(f"PDF file not found: {pdf_path}")
             raise
         except Exception as e:
             self.logger.error(f"Failed to extract text from PDF: {e}")
             raise
+
+    def iter_paragraphs(self, pdf_path: str) -> Iterator[str]:
+        """Yield non-empty paragraphs from a PDF, page by page.
+
+        Streams paragraphs as they are extracted instead of accumulating an
+        intermediate list, so consumers that process incrementally never hold
+        more than one paragraph plus the current page in memory.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Yields:
+            Paragraph texts with intra-paragraph line breaks flattened
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            for page_num, page in enumerate(doc):
+                try:
+                    for block in page.get_text("blocks", flags=_BLOCK_FLAGS):
+                        paragraph_text = block[4].translate(_NL_TO_SPACE).strip()
+                        if paragraph_text:
+                            yield paragraph_text
+                except Exception as e:
+                    self.logger.warning(f"Error processing page {page_num + 1}: {e}")
+                    continue
+        finally:
+            doc.close()
     
     def get_pdf_info(self, pdf_path: str) -> dict:
         """Get basic information about the PDF file.
@@ -68,7 +89,7 @@ class PDFProcessor:
             info = {
                 'page_count': len(doc),
                 'metadata': doc.metadata,
-                'file_size': doc.tobytes().__sizeof__(),
+                'file_size': os.path.getsize(pdf_path),
                 'is_encrypted': doc.is_encrypted,
                 'is_pdf': doc.is_pdf
             }
@@ -0,0 +1,306 @@
+"""Q&A evaluation module for scoring extracted pairs against a golden reference set."""
+
+import hashlib
+import json
+import logging
+import os
+from typing import List, Dict, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, install with: pip install legend-qa-extractor[eval]
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional dependency, install with: pip install legend-qa-extractor[eval]
+    SentenceTransformer = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, falls back to the stdlib json loader
+    orjson = None
+
+from ..utils.file_utils import ensure_dir, load_jsonl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+
+class QAEvaluator:
+    """Evaluates generated Q&A pairs against a golden set using sentence embeddings.
+
+    Each golden question is matched to the most similar generated question, and
+    answer similarity is computed for matched pairs. All question embeddings are
+    computed in batched encode calls up front, so matching reduces to a single
+    matrix multiplication instead of re-encoding candidates per golden pair.
+    """
+
+    def __init__(self, golden_qa_pairs: List[Dict[str, Any]],
+                 generated_qa_pairs: List[Dict[str, Any]],
+                 model_name: str = DEFAULT_EMBEDDING_MODEL,
+                 embedding_model: Optional[Any] = None,
+                 batch_size: int = 64,
+                 cache_dir: Optional[str] = None,
+                 device: Optional[str] = None):
+        """Initialize the evaluator.
+
+        Args:
+            golden_qa_pairs: Reference Q&A pairs (dicts with 'question' and 'answer')
+            generated_qa_pairs: Extracted Q&A pairs to evaluate
+            model_name: Sentence-transformers model name to load
+            embedding_model: Pre-loaded embedding model (overrides model_name)
+            batch_size: Batch size for embedding computation
+            cache_dir: Directory for on-disk embedding cache (disabled if None)
+            device: Torch device for the embedding model (e.g. 'cuda', 'cpu').
+                If None, sentence-transformers picks the GPU when available.
+        """
+        if np is None or (embedding_model is None and SentenceTransformer is None):
+            raise ImportError(
+                "numpy and sentence-transformers are required for evaluation. "
+                "Install them with: pip install legend-qa-extractor[eval]"
+            )
+
+        if embedding_model is None:
+            embedding_model = SentenceTransformer(model_name, device=device)
+            logger.info(f"Embedding model loaded on device: {embedding_model.device}")
+
+        self.logger = logger
+        self.golden_qa_pairs = golden_qa_pairs
+        self.generated_qa_pairs = generated_qa_pairs
+        self.embedding_model = embedding_model
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def from_files(cls, golden_path: str, generated_path: str, **kwargs) -> "QAEvaluator":
+        """Create an evaluator from golden and generated JSONL files.
+
+        Args:
+            golden_path: Path to golden Q&A pairs JSONL file
+            generated_path: Path to generated Q&A pairs JSONL file
+            **kwargs: Additional arguments passed to the constructor
+
+        Returns:
+            QAEvaluator instance with loaded Q&A pairs
+        """
+        return cls(cls.load_qa_pairs(golden_path), cls.load_qa_pairs(generated_path), **kwargs)
+
+    @staticmethod
+    def load_qa_pairs(file_path: str) -> List[Dict[str, Any]]:
+        """Load Q&A pairs from a JSONL file.
+
+        Uses orjson over raw bytes when available, which skips the per-line
+        decode/strip round-trip of the stdlib loader. Items without a
+        non-empty question and answer are dropped in a single filtering pass.
+
+        Args:
+            file_path: Path to JSONL file
+
+        Returns:
+            List of valid Q&A pair dictionaries
+        """
+        if orjson is None:
+            return QAEvaluator._filter_valid(load_jsonl(file_path))
+
+        if not os.path.exists(file_path):
+            logger.warning(f"File not found: {file_path}")
+            return []
+
+        pairs = []
+        try:
+            with open(file_path, 'rb') as f:
+                for line_num, line in enumerate(f, 1):
+                    if not line.isspace():
+                        try:
+                            pairs.append(orjson.loads(line))
+                        except orjson.JSONDecodeError as e:
+                            logger.warning(f"Failed to parse line {line_num} in {file_path}: {e}")
+
+            pairs = QAEvaluator._filter_valid(pairs)
+            logger.info(f"Loaded {len(pairs)} valid Q&A pairs from {file_path}")
+            return pairs
+
+        except Exception as e:
+            logger.error(f"Failed to load data from {file_path}: {e}")
+            return []
+
+    @staticmethod
+    def save_report(results: Dict[str, Any], file_path: str) -> None:
+        """Save an evaluation report to a JSON file.
+
+        Uses orjson's native serializer when available, which writes bytes
+        directly without building an intermediate Python string.
+
+        Args:
+            results: Evaluation results from evaluate_qa_extraction
+            file_path: Path to the output JSON file
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            ensure_dir(directory)
+
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"Evaluation report saved to {file_path}")
+
+    @staticmethod
+    def _filter_valid(pairs: List[Any]) -> List[Dict[str, Any]]:
+        """Keep only well-formed Q&A pairs in a single comprehension pass.
+
+        Args:
+            pairs: Loaded items to validate
+
+        Returns:
+            Items that are dicts with non-empty question and answer fields
+        """
+        return [
+            qa for qa in pairs
+            if isinstance(qa, dict) and qa.get("question") and qa.get("answer")
+        ]
+
+    def _encode(self, texts: List[str]) -> "np.ndarray":
+        """Encode texts into normalized embeddings in a single batched call.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            2D array of normalized embeddings, one row per text
+        """
+        cache_path = None
+        if self.cache_dir:
+            cache_path = self._embedding_cache_path(texts)
+            if os.path.exists(cache_path):
+                self.logger.info(f"Loading cached embeddings from {cache_path}")
+                return np.load(cache_path)
+
+        embeddings = self.embedding_model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype(np.float32, copy=False)
+
+        if cache_path:
+            ensure_dir(self.cache_dir)
+            np.save(cache_path, embeddings)
+
+        return embeddings
+
+    def _embedding_cache_path(self, texts: List[str]) -> str:
+        """Build the cache file path for a batch of texts.
+
+        The key hashes the model name and the text contents, so any change to
+        either invalidates the cached embeddings.
+
+        Args:
+            texts: Texts the embeddings belong to
+
+        Returns:
+            Path to the cache file for this batch
+        """
+        digest = hashlib.sha256()
+        digest.update(self.model_name.encode('utf-8'))
+        for text in texts:
+            digest.update(b'\x00')
+            digest.update(text.encode('utf-8'))
+        return os.path.join(self.cache_dir, f"embeddings_{digest.hexdigest()}.npy")
+
+    def calculate_answer_similarity(self, answer1: str, answer2: str) -> float:
+        """Calculate cosine similarity between two answers.
+
+        Args:
+            answer1: First answer text
+            answer2: Second answer text
+
+        Returns:
+            Cosine similarity score between 0 and 1
+        """
+        emb = self._encode([answer1, answer2])
+        return float(emb[0] @ emb[1])
+
+    def evaluate_qa_extraction(self, similarity_threshold: float = 0.7) -> Dict[str, Any]:
+        """Evaluate generated Q&A pairs against the golden set.
+
+        Args:
+            similarity_threshold: Minimum question similarity for a match
+
+        Returns:
+            Evaluation metrics dictionary with detailed per-pair matches
+        """
+        golden = self.golden_qa_pairs
+        generated = self.generated_qa_pairs
+        golden_count = len(golden)
+        generated_count = len(generated)
+
+        if not golden or not generated:
+            return {
+                'golden_count': golden_count,
+                'generated_count': generated_count,
+                'matched_count': 0,
+                'match_rate': 0.0,
+                'avg_question_similarity': 0.0,
+                'avg_answer_similarity': 0.0,
+                'detailed_matches': []
+            }
+
+        # Encode all questions and answers from both sets in one batched call,
+        # then slice the embedding matrix; every per-call overhead is paid once.
+        all_texts = (
+            [qa["question"] for qa in golden] + [qa["answer"] for qa in golden] +
+            [qa["question"] for qa in generated] + [qa["answer"] for qa in generated]
+        )
+        emb = self._encode(all_texts)
+        golden_q_emb, golden_a_emb, gen_q_emb, gen_a_emb = np.split(
+            emb, [golden_count, 2 * golden_count, 2 * golden_count + generated_count]
+        )
+
+        sims = golden_q_emb @ gen_q_emb.T
+        best_idx = sims.argmax(axis=1)
+        best_sim = np.take_along_axis(sims, best_idx[:, None], axis=1).ravel()
+
+        # Answer similarity for all matched pairs at once, no further encode calls
+        answer_sims = np.einsum('ij,ij->i', golden_a_emb, gen_a_emb[best_idx])
+
+        # All thresholding and rounding happens on whole arrays; the report
+        # rows are then assembled in one comprehension over plain Python values
+        matched = best_sim >= similarity_threshold
+        answer_sims = np.where(matched, answer_sims, 0.0)
+        matched_count = int(matched.sum())
+
+        question_sim_list = best_sim.round(4).tolist()
+        answer_sim_list = answer_sims.round(4).tolist()
+        detailed_matches = [
+            {
+                'golden_question': golden[i]["question"][:100],
+                'matched_question': generated[idx]["question"][:100],
+                'question_similarity': question_sim,
+                'answer_similarity': answer_sim,
+                'is_match': is_match
+            }
+            for i, (idx, question_sim, answer_sim, is_match) in enumerate(
+                zip(best_idx.tolist(), question_sim_list, answer_sim_list, matched.tolist())
+            )
+        ]
+
+        self.logger.info(
+            f"Evaluation completed: {matched_count}/{golden_count} golden questions matched"
+        )
+
+        return {
+            'golden_count': golden_count,
+            'generated_count': generated_count,
+            'matched_count': matched_count,
+            'match_rate': matched_count / golden_count,
+            'avg_question_similarity': float(best_sim.mean()),
+            'avg_answer_similarity': float(answer_sims.sum()) / matched_count if matched_count > 0 else 0.0,
+            'detailed_matches': detailed_matches
+        }
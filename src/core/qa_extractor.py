@@ -5,19 +5,24 @@ import re
 from typing import List, Dict, Any, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, falls back to the stdlib json parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
 
-class QAExtractor:
-    """Handles extraction and processing of Q&A pairs from LLM responses."""
-    
-    def __init__(self):
-        self.logger = logger
-        self.base_prompt = self._get_base_prompt()
-    
-    def _get_base_prompt(self) -> str:
-        """Get the base prompt for Q&A extraction."""
-        return """
+# orjson's JSONDecodeError subclasses json.JSONDecodeError, so existing
+# except clauses cover both parsers
+_loads = orjson.loads if orjson is not None else json.loads
+
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+
+# Multi-KB constant; built once at import instead of per QAExtractor instance
+_BASE_PROMPT = """
 你是一个专业的中文问答对提取专家。请从给定的原文中提取**所有**有效的问答对。
 
 🎯 核心任务：
@@ -70,6 +75,20 @@ class QAExtractor:
 
 🔍 请仔细分析以下原文，识别所有引发段永平回应的内容（包括直接提问、文章引用、描述等），并提取所有符合条件的问答对：
 """
+
+
+class QAExtractor:
+    """Handles extraction and processing of Q&A pairs from LLM responses."""
+    
+    # Rough tokens-per-character ratio for Chinese text with this model family
+    TOKEN_CHAR_RATIO = 1.5
+
+    def __init__(self):
+        self.logger = logger
+        self.base_prompt = _BASE_PROMPT
+        # The base prompt never changes, so its token estimate is computed
+        # once here instead of on every per-block budget check
+        self.base_prompt_tokens = self.estimate_token_count(_BASE_PROMPT)
     
     def create_prompt(self, text: str) -> str:
         """Create complete prompt with the given text.
@@ -80,8 +99,44 @@ class QAExtractor:
         Returns:
             Complete prompt string
         """
-        return self.base_prompt + "\n\n" + text
+        return _BASE_PROMPT + "\n\n" + text
     
+    def estimate_token_count(self, text: str) -> int:
+        """Estimate the token count of a text using a character heuristic.
+
+        Args:
+            text: Text to estimate
+
+        Returns:
+            Estimated token count
+        """
+        return self.estimate_block_tokens(len(text))
+
+    def estimate_block_tokens(self, char_len: int) -> int:
+        """Estimate tokens from a known character count.
+
+        Fast path for callers that already hold the block length (e.g. the
+        hybrid block builder), avoiding a redundant len() on the text.
+
+        Args:
+            char_len: Character count of the text
+
+        Returns:
+            Estimated token count
+        """
+        return int(char_len * self.TOKEN_CHAR_RATIO)
+
+    def estimate_prompt_tokens(self, block_char_len: int) -> int:
+        """Estimate the full prompt size for a block of given length.
+
+        Args:
+            block_char_len: Character count of the text block
+
+        Returns:
+            Estimated token count of base prompt plus block
+        """
+        return self.base_prompt_tokens + self.estimate_block_tokens(block_char_len)
+
     def extract_json(self, text: str) -> List[Dict[str, Any]]:
         """Extract JSON data from LLM response.
         
@@ -92,18 +147,32 @@ class QAExtractor:
             List of Q&A pair dictionaries
         """
         results = []
-        
+
         try:
-            # Try to find JSON blocks wrapped in ```json```
-            json_blocks = re.findall(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-            
-            if json_blocks:
-                for json_block in json_blocks:
-                    results.extend(self._parse_json_content(json_block))
-            else:
-                # If no ```json``` wrapper, parse the entire text
+            # Fast path: a well-behaved model returns a bare JSON array with
+            # no fence or surrounding prose — parse it directly and skip the
+            # regex/recovery machinery entirely
+            stripped = text.strip()
+            if stripped.startswith('['):
+                try:
+                    data = _loads(stripped)
+                    if isinstance(data, list):
+                        return [item for item in data if self._is_valid_qa_pair(item)]
+                except json.JSONDecodeError:
+                    pass
+
+            # Cheap containment check skips the DOTALL regex entirely on the
+            # common no-fence path
+            fence_found = False
+            if '```json' in text:
+                for match in _JSON_FENCE_RE.finditer(text):
+                    fence_found = True
+                    results.extend(self._parse_json_content(match.group(1)))
+
+            if not fence_found:
+                # If no complete ```json``` wrapper, parse the entire text
                 results.extend(self._parse_json_content(text))
-        
+
         except Exception as e:
             self.logger.error(f"JSON extraction error: {e}\nOriginal response:\n{text}")
         
@@ -132,7 +201,7 @@ class QAExtractor:
         
         try:
             # First try to parse as JSON (could be array or single object)
-            data = json.loads(content)
+            data = _loads(content)
             if isinstance(data, list):
                 # If it's an array, extend results
                 for item in data:
@@ -144,49 +213,24 @@ class QAExtractor:
             return results
             
         except json.JSONDecodeError:
-            # If JSON parsing fails, try to separate multiple JSON objects
-            try:
-                json_objects = self._extract_json_objects(content)
-                for json_str in json_objects:
-                    try:
-                        data = json.loads(json_str)
-                        if isinstance(data, dict):
-                            results.append(data)
-                    except json.JSONDecodeError:
-                        continue
-                        
-            except Exception as e:
-                self.logger.error(f"JSON object separation failed: {e}\nContent:\n{content}")
-        
+            # If JSON parsing fails, scan for embedded JSON objects with the
+            # C-level raw_decode instead of a per-character Python walk
+            pos = 0
+            length = len(content)
+            while pos < length:
+                pos = content.find('{', pos)
+                if pos < 0:
+                    break
+                try:
+                    data, end = _JSON_DECODER.raw_decode(content, pos)
+                    if isinstance(data, dict):
+                        results.append(data)
+                    pos = end
+                except json.JSONDecodeError:
+                    pos += 1
+
         return results
     
-    def _extract_json_objects(self, content: str) -> List[str]:
-        """Extract individual JSON objects from text containing multiple objects.
-        
-        Args:
-            content: Text content containing JSON objects
-            
-        Returns:
-            List of JSON object strings
-        """
-        json_objects = []
-        brace_count = 0
-        start_pos = -1
-        
-        for i, char in enumerate(content):
-            if char == '{':
-                if brace_count == 0:
-                    start_pos = i
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0 and start_pos != -1:
-                    json_str = content[start_pos:i+1]
-                    json_objects.append(json_str)
-                    start_pos = -1
-        
-        return json_objects
-    
     def _is_valid_qa_pair(self, data: Any) -> bool:
         """Check if the data is a valid Q&A pair.
         
@@ -196,11 +240,22 @@ class QAExtractor:
         Returns:
             True if valid Q&A pair, False otherwise
         """
-        return (isinstance(data, dict) and 
-                "question" in data and "answer" in data and
-                data.get("question") and data.get("answer") and
-                str(data.get("question", "")).strip() and 
-                str(data.get("answer", "")).strip())
+        if not isinstance(data, dict):
+            return False
+
+        # Fetch each value once; falsy (missing/empty/None) fails fast and
+        # str() only runs on non-string payloads
+        question = data.get("question")
+        answer = data.get("answer")
+        if not question or not answer:
+            return False
+
+        if not isinstance(question, str):
+            question = str(question)
+        if not isinstance(answer, str):
+            answer = str(answer)
+
+        return bool(question.strip() and answer.strip())
     
     def process_qa_pairs(self, qa_pairs: List[Dict[str, Any]], 
                         source_text: str, 
@@ -215,25 +270,22 @@ class QAExtractor:
         Returns:
             List of processed Q&A pairs
         """
-        processed_pairs = []
-        
-        for qa_pair in qa_pairs:
-            if not self._is_valid_qa_pair(qa_pair):
-                continue
-            
-            # Clean question text
-            clean_question = text_processor.clean_question_text(qa_pair["question"])
-            
-            # Create final Q&A pair
-            final_pair = {
-                "question": clean_question,
+        # Validate first, then clean all surviving questions in one batch
+        # call — one regex-engine entry per response instead of one per pair
+        is_valid = self._is_valid_qa_pair
+        valid_pairs = [qa_pair for qa_pair in qa_pairs if is_valid(qa_pair)]
+        questions = text_processor.clean_question_texts(
+            [qa_pair["question"] for qa_pair in valid_pairs]
+        )
+
+        return [
+            {
+                "question": question,
                 "answer": qa_pair["answer"],
                 "source_text": source_text
             }
-            
-            processed_pairs.append(final_pair)
-        
-        return processed_pairs
+            for question, qa_pair in zip(questions, valid_pairs)
+        ]
     
     def validate_extraction_quality(self, original_text: str, 
                                    qa_pairs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -257,16 +309,25 @@ class QAExtractor:
         if not qa_pairs:
             return metrics
         
-        # Calculate average lengths
-        question_lengths = [len(pair['question']) for pair in qa_pairs]
-        answer_lengths = [len(pair['answer']) for pair in qa_pairs]
-        
-        metrics['avg_question_length'] = sum(question_lengths) / len(question_lengths)
-        metrics['avg_answer_length'] = sum(answer_lengths) / len(answer_lengths)
-        
-        # Check for duplicates
-        questions = [pair['question'] for pair in qa_pairs]
-        metrics['has_duplicates'] = len(questions) != len(set(questions))
+        # One pass over the pairs gathers length sums and duplicate state
+        # instead of building three intermediate lists
+        question_sum = 0
+        answer_sum = 0
+        seen_questions = set()
+        has_duplicates = False
+        for pair in qa_pairs:
+            question = pair['question']
+            question_sum += len(question)
+            answer_sum += len(pair['answer'])
+            if question in seen_questions:
+                has_duplicates = True
+            else:
+                seen_questions.add(question)
+
+        pair_count = len(qa_pairs)
+        metrics['avg_question_length'] = question_sum / pair_count
+        metrics['avg_answer_length'] = answer_sum / pair_count
+        metrics['has_duplicates'] = has_duplicates
         
         # Calculate quality score (simple heuristic)
         score = 0.0
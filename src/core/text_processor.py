@@ -1,202 +1,361 @@
 """Text processing module for handling text segmentation and cleaning."""
 
 import re
-from typing import List
+from typing import List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# All hot-path patterns are compiled once at import time so per-block calls
+# only execute the matcher, never pattern parsing/compilation.
+# 段永平 must precede 段 so the longer token wins.
+_NORMALIZE_RE = re.compile(r'(网友|段永平|段|大道|问)[：:]')
+
+_COLLAPSE_NL_RE = re.compile(r'\n\s*\n\s*\n')
+
+_FALLBACK_PREFIX_RE = re.compile(
+    r'^[一-龥A-Za-z0-9（）【】「」《》''""、,，.。·\s]{1,20}[：:]\s*'
+)
+
+_DIRECT_QUESTION_RE = re.compile(
+    r'网友[：:]|问[：:]|问题[：:]|提问[：:]|主持人[：:]|观众[：:]|Q[：:]'
+)
+
+_INDIRECT_QUESTION_RE = re.compile(
+    r'文章引用[：:]|引用[：:]|有人说|有人认为|有观点认为|据说|听说'
+)
+
+# Direct and indirect markers fused into one alternation: block_has_qa only
+# needs "any question marker present", so one scan covers both classes
+_QUESTION_RE = re.compile(
+    r'网友[：:]|问[：:]|问题[：:]|提问[：:]|主持人[：:]|观众[：:]|Q[：:]'
+    r'|文章引用[：:]|引用[：:]|有人说|有人认为|有观点认为|据说|听说'
+)
+
+_ANSWER_RE = re.compile(r'段永平[：:]|段[：:]|大道[：:]')
+
+_CJK_RE = re.compile(r'[一-龥]')
+
+# Single alternation used by the fused classify+normalize pass. Longer tokens
+# come first so e.g. 段永平/问题 win over their prefixes 段/问.
+_QA_TOKEN_RE = re.compile(
+    r'(文章引用|段永平|提问|问题|主持人|观众|引用|网友|段|大道|问|Q)[：:]'
+    r'|有人说|有人认为|有观点认为|据说|听说'
+)
+
+_DEFAULT_KNOWN_PREFIXES = (
+    "网友", "记者", "问", "提问者", "主持人",
+    "文章引用", "Q", "观众", "评论", "主持", "用户"
+)
+
+
+def _compile_prefix_patterns(prefixes) -> Tuple["re.Pattern", "re.Pattern", tuple]:
+    """Build the per-prefix-set matching machinery.
+
+    Longest-first ordering makes the leftmost-first alternation pick the
+    full prefix when one prefix is a prefix of another (e.g. 主持人 before
+    主持), regardless of the configured list order.
+
+    Args:
+        prefixes: Iterable of question prefixes
+
+    Returns:
+        Tuple of (anchored prefix pattern, batch sentinel-anchored pattern,
+        startswith gate tuple)
+    """
+    alternation = '|'.join(
+        re.escape(p) for p in sorted(prefixes, key=len, reverse=True)
+    )
+    return (
+        re.compile(r'^({})[：:]\s*'.format(alternation)),
+        # \s would match the \x1f sentinel itself (re treats the 0x1c-0x1f
+        # separators as whitespace), merging an empty-remainder question
+        # into its neighbour; [^\S\x1f] is whitespace minus the sentinel
+        re.compile(r'(?:^|(?<=\x1f))({})[：:][^\S\x1f]*'.format(alternation)),
+        tuple(p + colon for p in prefixes for colon in ('：', ':')),
+    )
+
+
+# The default prefix set is by far the common construction path, so its
+# patterns are compiled once at import and shared by every such instance
+_DEFAULT_PREFIX_PATTERNS = _compile_prefix_patterns(_DEFAULT_KNOWN_PREFIXES)
+
+# 提问 is included because the unfused _NORMALIZE_RE pass rewrites its embedded
+# 问[:] — the fused pass must emit the same full-width colon for parity
+_NORMALIZED_PREFIXES = frozenset({'网友', '问', '提问', '段永平', '段', '大道'})
+_DIRECT_QUESTION_TAGS = frozenset({'网友', '问', '问题', '提问', '主持人', '观众', 'Q'})
+_INDIRECT_QUESTION_TAGS = frozenset({'文章引用', '引用'})
+_ANSWER_TAGS = frozenset({'段永平', '段', '大道'})
+
 
 class TextProcessor:
     """Handles text processing, segmentation, and cleaning operations."""
-    
+
+    # No __dict__ per instance: attribute reads in the per-block methods
+    # resolve through slot descriptors, and the instance footprint shrinks
+    # to the five references below
+    __slots__ = ('logger', 'known_prefixes', '_prefix_re',
+                 '_batch_prefix_re', '_prefix_tuple')
+
     def __init__(self, known_prefixes: List[str] = None):
         self.logger = logger
-        self.known_prefixes = known_prefixes or [
-            "网友", "记者", "问", "提问者", "主持人", 
-            "文章引用", "Q", "观众", "评论", "主持", "用户"
-        ]
-    
+        # Default-configured instances share the import-time compiled
+        # patterns; only a customized prefix set pays for compilation.
+        # _prefix_re anchors at the question start, _batch_prefix_re at each
+        # sentinel boundary for clean_question_texts, and _prefix_tuple is
+        # the C-level startswith gate in front of both
+        if not known_prefixes or tuple(known_prefixes) == _DEFAULT_KNOWN_PREFIXES:
+            self.known_prefixes = list(_DEFAULT_KNOWN_PREFIXES)
+            patterns = _DEFAULT_PREFIX_PATTERNS
+        else:
+            self.known_prefixes = list(known_prefixes)
+            patterns = _compile_prefix_patterns(self.known_prefixes)
+        self._prefix_re, self._batch_prefix_re, self._prefix_tuple = patterns
+
     def preprocess_qa_text(self, text: str) -> str:
         """Preprocess text to standardize Q&A formats.
-        
+
         Args:
             text: Raw text to preprocess
-            
+
         Returns:
             Preprocessed text with standardized formats
         """
         if not text:
             return ""
-        
-        # Standardize Q&A identifiers
-        text = re.sub(r'网友[：:]', '网友：', text)
-        text = re.sub(r'问[：:]', '问：', text)
-        text = re.sub(r'段永平[：:]', '段永平：', text)
-        text = re.sub(r'段[：:]', '段：', text)
-        text = re.sub(r'大道[：:]', '大道：', text)
-        
+
+        # Blocks without any colon cannot contain an identifier to normalize;
+        # the containment checks are C-level and skip the regex entirely
+        if '：' in text or ':' in text:
+            # Standardize Q&A identifiers in one pass
+            text = _NORMALIZE_RE.sub(r'\1：', text)
+
         # Clean extra blank lines
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-        
+        text = _COLLAPSE_NL_RE.sub('\n\n', text)
+
         return text
-    
+
+    def classify_and_preprocess(self, text: str) -> Tuple[bool, str]:
+        """Classify Q&A presence and normalize formats in a single scan.
+
+        Fuses block_has_qa and preprocess_qa_text: one traversal with the
+        combined token alternation both records which pattern classes appear
+        and canonicalizes the colon variants, instead of walking the block
+        once for filtering and again for normalization.
+
+        Args:
+            text: Raw text block
+
+        Returns:
+            Tuple of (block contains Q&A patterns, normalized text)
+        """
+        if not text:
+            return False, ""
+
+        seen = set()
+
+        def _replace(match: "re.Match[str]") -> str:
+            token = match.group(1)
+            if token is None:
+                # Bare indirect marker such as 有人说/据说
+                seen.add('indirect')
+                return match.group(0)
+            if token in _ANSWER_TAGS:
+                seen.add('answer')
+            elif token in _DIRECT_QUESTION_TAGS:
+                seen.add('direct')
+            elif token in _INDIRECT_QUESTION_TAGS:
+                seen.add('indirect')
+            if token in _NORMALIZED_PREFIXES:
+                return token + '：'
+            return match.group(0)
+
+        normalized = _QA_TOKEN_RE.sub(_replace, text)
+        normalized = _COLLAPSE_NL_RE.sub('\n\n', normalized)
+
+        has_qa = 'answer' in seen and ('direct' in seen or 'indirect' in seen)
+        return has_qa, normalized
+
     def clean_question_text(self, question: str) -> str:
         """Remove question prefixes from question text.
-        
+
         Args:
             question: Question text with potential prefixes
-            
+
         Returns:
             Cleaned question text without prefixes
         """
         if question is None:
             return ""
-        
+
         question = str(question)
-        
-        # Known prefixes pattern
-        pattern = r'^({})[：:]\s*'.format('|'.join(re.escape(p) for p in self.known_prefixes))
-        cleaned = re.sub(pattern, '', question).strip()
+
+        # Known prefixes pattern; the startswith gate means the regex only
+        # runs when it is guaranteed to match
+        if question.startswith(self._prefix_tuple):
+            return self._prefix_re.sub('', question).strip()
+
+        cleaned = question.strip()
         if cleaned != question:
             return cleaned
 
         # Fallback pattern for unknown prefixes
-        fallback_pattern = r'^[\u4e00-\u9fa5A-Za-z0-9（）【】「」《》''""、,，.。·\s]{1,20}[：:]\s*'
-        return re.sub(fallback_pattern, '', question).strip()
-    
+        return _FALLBACK_PREFIX_RE.sub('', question).strip()
+
+    def clean_question_texts(self, questions: List[str]) -> List[str]:
+        """Remove question prefixes from a batch of questions in one pass.
+
+        Joins the questions with a sentinel and runs a single anchored
+        substitution over the joined text, so the regex engine is entered
+        once per batch instead of once per question; only questions the
+        known-prefix pass left untouched fall back to the per-item pattern.
+
+        Args:
+            questions: Question texts with potential prefixes
+
+        Returns:
+            Cleaned question texts, in input order
+        """
+        if not questions:
+            return []
+
+        items = ['' if q is None else str(q) for q in questions]
+        # The unit-separator sentinel never occurs in extracted text; if it
+        # somehow does, fall back to the per-item path for correctness
+        if any('\x1f' in item for item in items):
+            return [self.clean_question_text(q) for q in questions]
+
+        joined = '\x1f'.join(items)
+        cleaned_items = self._batch_prefix_re.sub('', joined).split('\x1f')
+
+        results = []
+        for original, cleaned in zip(items, cleaned_items):
+            cleaned = cleaned.strip()
+            if cleaned != original:
+                results.append(cleaned)
+            else:
+                results.append(_FALLBACK_PREFIX_RE.sub('', original).strip())
+        return results
+
     def create_hybrid_blocks(self, text: str, max_size: int, min_size: int) -> List[str]:
         """Create text blocks using hybrid natural paragraph merging strategy.
-        
+
         Args:
             text: Input text to segment
             max_size: Maximum block size in characters
             min_size: Minimum block size in characters
-            
+
         Returns:
             List of text blocks
         """
         if not text:
             return []
-        
+
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        # Lengths are computed once; the packing loop then works purely on
+        # index arithmetic and emits each block as a single slice-join
+        para_lens = [len(p) for p in paragraphs]
+        para_count = len(paragraphs)
         all_blocks = []
         i = 0
 
-        while i < len(paragraphs):
-            block_paras = []
-            current_len = 0
-
-            while i < len(paragraphs):
-                para = paragraphs[i]
-                # Check if adding this paragraph would exceed max_size
-                if current_len > 0 and current_len + len(para) > max_size:
-                    break
-                
-                block_paras.append(para)
-                current_len += len(para)
-                i += 1
-
-                # If we've reached or exceeded max_size, break
-                if current_len >= max_size:
-                    break
-
-            if block_paras:  # Only create block if we have paragraphs
-                block_text = "\n\n".join(block_paras)
-                if len(block_text) >= min_size:
-                    all_blocks.append(block_text)
+        while i < para_count:
+            start = i
+            current_len = para_lens[i]
+            i += 1
+
+            if current_len < max_size:
+                while i < para_count:
+                    # Check if adding this paragraph would exceed max_size
+                    if current_len + para_lens[i] > max_size:
+                        break
+
+                    current_len += para_lens[i]
+                    i += 1
+
+                    # If we've reached or exceeded max_size, break
+                    if current_len >= max_size:
+                        break
+
+            # Account for the joined separators without building the string
+            if current_len + 2 * (i - start - 1) >= min_size:
+                all_blocks.append("\n\n".join(paragraphs[start:i]))
 
         self.logger.info(f"Created {len(all_blocks)} text blocks")
         return all_blocks
-    
+
     def block_has_qa(self, text: str) -> bool:
         """Check if text block contains Q&A patterns.
-        
+
         Args:
             text: Text block to analyze
-            
+
         Returns:
             True if block contains Q&A patterns, False otherwise
         """
         if not text:
             return False
-        
-        # Direct question patterns
-        direct_question_patterns = [
-            r"网友[：:]",
-            r"问[：:]",
-            r"问题[：:]", 
-            r"提问[：:]",
-            r"主持人[：:]",
-            r"观众[：:]",
-            r"Q[：:]"
-        ]
-        
-        # Indirect question patterns
-        indirect_question_patterns = [
-            r"文章引用[：:]",
-            r"引用[：:]",
-            r"有人说",
-            r"有人认为",
-            r"有观点认为",
-            r"据说",
-            r"听说"
-        ]
-        
-        # Answer patterns
-        answer_patterns = [
-            r"段永平[：:]",
-            r"段[：:]",
-            r"大道[：:]"
-        ]
-        
-        has_direct_question = any(re.search(p, text) for p in direct_question_patterns)
-        has_indirect_question = any(re.search(p, text) for p in indirect_question_patterns)
-        has_answer = any(re.search(p, text) for p in answer_patterns)
-        
-        return bool(has_answer and (has_direct_question or has_indirect_question))
-    
+
+        # Exactly two C-level scans: the (rarer) answer markers first, then
+        # one fused alternation covering both direct and indirect questions
+        if not _ANSWER_RE.search(text):
+            return False
+
+        return _QUESTION_RE.search(text) is not None
+
     def filter_blocks_by_ratio(self, blocks: List[str], ratio: float) -> List[str]:
         """Filter blocks by sampling ratio.
-        
+
+        Samples uniformly across the document rather than taking the first
+        N blocks, so partial runs are not biased toward the table of
+        contents and opening chapters.
+
         Args:
             blocks: List of text blocks
             ratio: Sampling ratio (0.0 to 1.0)
-            
+
         Returns:
             Filtered list of blocks
         """
-        if ratio >= 1.0:
+        if not blocks or ratio >= 1.0:
             return blocks
-        
+
         if ratio <= 0.0:
             return []
-        
-        sample_size = max(int(len(blocks) * ratio), 1)
-        filtered_blocks = blocks[:sample_size]
-        
+
+        total = len(blocks)
+        sample_size = max(int(total * ratio), 1)
+        # Evenly spaced, deterministic indices over the whole document
+        filtered_blocks = [blocks[i * total // sample_size] for i in range(sample_size)]
+
         self.logger.info(f"Filtered {len(filtered_blocks)} blocks from {len(blocks)} (ratio: {ratio:.1%})")
         return filtered_blocks
-    
+
     def validate_text_quality(self, text: str) -> bool:
         """Validate text quality for processing.
-        
+
         Args:
             text: Text to validate
-            
+
         Returns:
             True if text quality is acceptable, False otherwise
         """
         if not text or not text.strip():
             return False
-        
+
         # Check minimum length
         if len(text.strip()) < 10:
             return False
-        
-        # Check if text has readable content (not just symbols or numbers)
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fa5]', text))
-        if chinese_chars < len(text) * 0.1:  # At least 10% Chinese characters
-            return False
-        
-        return True 
\ No newline at end of file
+
+        # Check if text has readable content (not just symbols or numbers):
+        # at least 10% Chinese characters. Counting via finditer avoids
+        # allocating a one-char string per CJK codepoint, and the loop stops
+        # as soon as the threshold is reached.
+        threshold = len(text) * 0.1
+        chinese_chars = 0
+        for _ in _CJK_RE.finditer(text):
+            chinese_chars += 1
+            if chinese_chars >= threshold:
+                return True
+
+        return False
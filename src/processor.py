@@ -1,12 +1,27 @@
 """Main processor class that orchestrates the Q&A extraction workflow."""
 
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, falls back to the stdlib json writer
+    orjson = None
+
 from .config import Config
 from .core import PDFProcessor, TextProcessor, QAExtractor, LLMClient
-from .utils import setup_logger, setup_extraction_loggers, save_single_jsonl_item, ensure_dir
+from .utils import setup_logger, setup_extraction_loggers, ensure_dir
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """Serialize one JSONL record, preferring orjson's native encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
 
 
 class QAExtractionProcessor:
@@ -27,22 +42,42 @@ class QAExtractionProcessor:
             log_file=os.path.join(config.output_dir, "main.log")
         )
         
-        # Set up specialized loggers
-        if config.enable_error_log or config.enable_success_log:
-            self.error_logger, self.success_logger = setup_extraction_loggers(config.output_dir)
+        # Set up specialized error logger; successes go straight to JSONL
+        if config.enable_error_log:
+            self.error_logger = setup_extraction_loggers(config.output_dir)
         else:
-            self.error_logger = self.success_logger = None
+            self.error_logger = None
+
+        if config.enable_success_log:
+            self.success_log_path = os.path.join(config.output_dir, "extraction_success.jsonl")
+        else:
+            self.success_log_path = None
         
         # Initialize processors
         self.pdf_processor = PDFProcessor()
         self.text_processor = TextProcessor(known_prefixes=config.known_prefixes)
         self.qa_extractor = QAExtractor()
-        
+
+        # Start extracting the configured PDF on a worker thread so the
+        # MuPDF parse overlaps with LLM client setup; process_pdf consumes
+        # the future when it targets the same file
+        self._prefetch_path = None
+        self._prefetch_future = None
+        if config.pdf_filename and os.path.exists(config.pdf_filename):
+            self._prefetch_path = os.path.abspath(config.pdf_filename)
+            prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            self._prefetch_future = prefetch_executor.submit(
+                self._extract_text_cached, self._prefetch_path
+            )
+            # Lets the worker thread exit as soon as the extraction finishes
+            prefetch_executor.shutdown(wait=False)
+
         # Initialize LLM client
         try:
             self.llm_client = LLMClient(
                 host=config.ollama_host,
-                model_name=config.model_name
+                model_name=config.model_name,
+                cache_path=config.llm_cache_path
             )
         except Exception as e:
             self.logger.error(f"Failed to initialize LLM client: {e}")
@@ -72,9 +107,14 @@ class QAExtractionProcessor:
         
         self.logger.info(f"🔎 Starting processing of file: {pdf_path}")
         
-        # Extract text from PDF
+        # Extract text from PDF (cached across runs when enabled)
         self.logger.info("📄 Extracting text from PDF...")
-        raw_text = self.pdf_processor.extract_text_from_pdf(pdf_path)
+        prefetch = self._prefetch_future
+        self._prefetch_future = None
+        if prefetch is not None and pdf_path == self._prefetch_path:
+            raw_text = prefetch.result()
+        else:
+            raw_text = self._extract_text_cached(pdf_path)
         self.logger.info(f"📄 Extracted {len(raw_text)} characters from PDF")
         
         # Get PDF info
@@ -90,11 +130,14 @@ class QAExtractionProcessor:
         )
         self.logger.info(f"✅ Created {len(blocks)} text blocks")
         
-        # Filter blocks if QA filtering is enabled
+        # Normalize blocks (and filter them in the same pass when enabled)
         if self.config.enable_qa_filter:
             original_count = len(blocks)
-            blocks = [b for b in blocks if self.text_processor.block_has_qa(b)]
+            classified = (self.text_processor.classify_and_preprocess(b) for b in blocks)
+            blocks = [normalized for has_qa, normalized in classified if has_qa]
             self.logger.info(f"⚡ QA filtering: {len(blocks)} blocks remaining (from {original_count})")
+        else:
+            blocks = [self.text_processor.preprocess_qa_text(b) for b in blocks]
         
         # Apply sampling ratio
         if self.config.extract_ratio < 1.0:
@@ -112,11 +155,7 @@ class QAExtractionProcessor:
         # Prepare output
         output_path = self._get_output_path()
         ensure_dir(os.path.dirname(output_path))
-        
-        # Clear output file
-        with open(output_path, "w", encoding="utf-8") as f:
-            pass
-        
+
         # Process blocks and extract Q&A pairs
         self.logger.info(f"🤖 Processing {len(blocks)} blocks with LLM...")
         results = self._process_blocks(blocks, output_path)
@@ -134,6 +173,47 @@ class QAExtractionProcessor:
             'pdf_info': pdf_info
         }
     
+    def _extract_text_cached(self, pdf_path: str) -> str:
+        """Extract text from PDF, reusing a cached text file when available.
+
+        The cache is content-addressed: the key is a hash of the PDF bytes,
+        so renamed or copied files hit the same entry while any content
+        change triggers a fresh PyMuPDF parse. Hashing reads the file once
+        at disk speed, which is orders of magnitude cheaper than MuPDF's
+        layout analysis.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Extracted text
+        """
+        if not self.config.enable_text_cache:
+            return self.pdf_processor.extract_text_from_pdf(pdf_path)
+
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        cache_name = digest.hexdigest() + ".txt"
+        cache_path = os.path.join(self.config.output_dir, "text_cache", cache_name)
+
+        if os.path.exists(cache_path):
+            self.logger.info(f"📄 Using cached extracted text: {cache_path}")
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        raw_text = self.pdf_processor.extract_text_from_pdf(pdf_path)
+
+        try:
+            ensure_dir(os.path.dirname(cache_path))
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(raw_text)
+        except OSError as e:
+            self.logger.warning(f"Failed to write text cache {cache_path}: {e}")
+
+        return raw_text
+
     def _process_blocks(self, blocks: List[str], output_path: str) -> List[Dict[str, Any]]:
         """Process text blocks and extract Q&A pairs.
         
@@ -146,87 +226,220 @@ class QAExtractionProcessor:
         """
         results = []
         success_count = 0
-        
-        for block_idx, block in enumerate(tqdm(blocks, desc="Extracting Q&A pairs")):
-            # Preprocess text
-            processed_block = self.text_processor.preprocess_qa_text(block)
-            
-            # Create prompt
-            prompt = self.qa_extractor.create_prompt(processed_block)
-            
-            # Call LLM
-            response = self.llm_client.call_ollama(
-                prompt, 
-                temperature=self.config.temperature
+        parallel_requests = max(1, self.config.parallel_requests)
+        # Length statistics are accumulated as pairs are written, so the
+        # pairs themselves never need to be retained after the write; for a
+        # large PDF that keeps memory at O(blocks) instead of O(qa_pairs)
+        self._stats_accum = {
+            'count': 0, 'q_sum': 0, 'a_sum': 0,
+            'q_min': None, 'q_max': 0, 'a_min': None, 'a_max': 0
+        }
+
+        def _call_llm(block: str) -> Optional[str]:
+            # Blocks arrive already normalized from process_pdf. The static
+            # instructions go as the system message so every request shares a
+            # byte-identical prefix and the server can reuse its KV cache.
+            return self.llm_client.call_ollama(
+                block,
+                temperature=self.config.temperature,
+                system=self.qa_extractor.base_prompt
             )
-            
-            if response is None:
-                self.logger.warning(f"❌ Block {block_idx + 1}: LLM call failed")
-                if self.error_logger:
-                    self.error_logger.error(
-                        f"LLM call failed for block {block_idx + 1}\n"
-                        f"Block content:\n{block}"
-                    )
-                results.append({
-                    'block_idx': block_idx,
-                    'success': False,
-                    'error': 'LLM call failed',
-                    'qa_count': 0
-                })
-                continue
-            
-            # Extract Q&A pairs
-            qa_pairs = self.qa_extractor.extract_json(response)
-            
-            if not qa_pairs:
-                self.logger.warning(f"❌ Block {block_idx + 1}: No Q&A pairs extracted")
-                if self.error_logger:
-                    self.error_logger.error(
-                        f"No valid Q&A pairs extracted for block {block_idx + 1}\n"
-                        f"LLM response: {response}\n"
-                        f"Block content:\n{block}"
-                    )
-                results.append({
-                    'block_idx': block_idx,
-                    'success': False,
-                    'error': 'No Q&A pairs extracted',
-                    'qa_count': 0
-                })
-                continue
-            
-            # Process and save Q&A pairs
-            processed_pairs = self.qa_extractor.process_qa_pairs(
-                qa_pairs, block, self.text_processor
+
+        # Infer each unique block once; duplicates (headers/footers, repeated
+        # paragraphs) replay the first occurrence's response
+        unique_index: Dict[str, int] = {}
+        unique_blocks = []
+        for block in blocks:
+            if block not in unique_index:
+                unique_index[block] = len(unique_blocks)
+                unique_blocks.append(block)
+
+        if len(unique_blocks) < len(blocks):
+            self.logger.info(
+                f"⚡ Deduplication: {len(unique_blocks)} unique blocks "
+                f"(from {len(blocks)})"
             )
-            
-            # Save each Q&A pair
-            for pair in processed_pairs:
-                save_single_jsonl_item(pair, output_path)
-            
-            # Log success
-            self.logger.info(f"✅ Block {block_idx + 1}: Extracted {len(processed_pairs)} Q&A pairs")
-            if self.success_logger:
-                for i, pair in enumerate(processed_pairs):
-                    success_log_content = (
-                        f"Successfully extracted Q&A pair #{success_count + i + 1} from block {block_idx + 1}:\n\n"
-                        f"Question: {pair['question']}\n\n"
-                        f"Answer: {pair['answer']}\n\n"
-                        f"Source block:\n{block}\n\n"
-                        f"{'='*80}"
+
+        # Ollama calls are blocking HTTP round-trips, so keep several in
+        # flight; executor.map yields responses in submission order, which
+        # keeps output deterministic. All parsing, writing and logging stays
+        # in this thread, so no locking is needed.
+        executor = None
+        if parallel_requests > 1:
+            executor = ThreadPoolExecutor(max_workers=parallel_requests)
+            unique_responses = executor.map(_call_llm, unique_blocks)
+        else:
+            unique_responses = map(_call_llm, unique_blocks)
+
+        def _replay_responses():
+            # First occurrences arrive in unique submission order, so the
+            # response iterator can be consumed lazily as blocks stream by
+            received: Dict[int, Optional[str]] = {}
+            for block in blocks:
+                idx = unique_index[block]
+                if idx not in received:
+                    received[idx] = next(unique_responses)
+                yield received[idx]
+
+        responses = _replay_responses()
+
+        # One buffered handle for the whole run instead of an open/append/close
+        # cycle per Q&A pair; same for the success JSONL
+        success_file = None
+        try:
+            if self.success_log_path:
+                ensure_dir(os.path.dirname(self.success_log_path))
+                success_file = open(self.success_log_path, "w", encoding="utf-8",
+                                    buffering=1 << 20)
+
+            with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as output_file:
+                for block_idx, (block, response) in enumerate(
+                    # Throttled redraws: with parallel workers blocks can
+                    # complete faster than the terminal can repaint.
+                    # disable=None turns the bar off entirely when stderr is
+                    # not a TTY (logs, CI), skipping every terminal write
+                    tqdm(zip(blocks, responses), total=len(blocks),
+                         desc="Extracting Q&A pairs", disable=None,
+                         miniters=max(1, len(blocks) // 200),
+                         mininterval=0.5, smoothing=0.05)
+                ):
+                    processed_pairs = self._handle_block_result(
+                        block_idx, block, response, output_file, results
                     )
-                    self.success_logger.info(success_log_content)
-            
-            success_count += len(processed_pairs)
-            
+                    if processed_pairs:
+                        success_count = self._log_success(
+                            block_idx, block, processed_pairs,
+                            success_count, success_file
+                        )
+        finally:
+            if success_file is not None:
+                success_file.close()
+            if executor is not None:
+                executor.shutdown()
+
+        return results
+
+    def _handle_block_result(self, block_idx: int, block: str,
+                             response: Optional[str],
+                             output_file: Any,
+                             results: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Parse one LLM response and record/write its Q&A pairs.
+
+        Args:
+            block_idx: Index of the block being processed
+            block: Normalized block text
+            response: LLM response text, or None if the call failed
+            output_file: Open output file handle for JSONL writes
+            results: Running list of per-block results to append to
+
+        Returns:
+            The processed Q&A pairs on success, None otherwise
+        """
+        if response is None:
+            self.logger.warning("❌ Block %d: LLM call failed", block_idx + 1)
+            if self.error_logger:
+                self.error_logger.error(
+                    "LLM call failed for block %d\nBlock content:\n%s",
+                    block_idx + 1, block
+                )
             results.append({
                 'block_idx': block_idx,
-                'success': True,
-                'qa_count': len(processed_pairs),
-                'qa_pairs': processed_pairs
+                'success': False,
+                'error': 'LLM call failed',
+                'qa_count': 0
             })
-        
-        return results
-    
+            return None
+
+        # Extract Q&A pairs
+        qa_pairs = self.qa_extractor.extract_json(response)
+
+        if not qa_pairs:
+            self.logger.warning("❌ Block %d: No Q&A pairs extracted", block_idx + 1)
+            if self.error_logger:
+                self.error_logger.error(
+                    "No valid Q&A pairs extracted for block %d\n"
+                    "LLM response: %s\nBlock content:\n%s",
+                    block_idx + 1, response, block
+                )
+            results.append({
+                'block_idx': block_idx,
+                'success': False,
+                'error': 'No Q&A pairs extracted',
+                'qa_count': 0
+            })
+            return None
+
+        # Process and save Q&A pairs
+        processed_pairs = self.qa_extractor.process_qa_pairs(
+            qa_pairs, block, self.text_processor
+        )
+
+        # Save each Q&A pair through the shared buffered handle, folding its
+        # lengths into the running statistics; the pairs are not kept in the
+        # results list so they can be freed once written and logged
+        accum = self._stats_accum
+        for pair in processed_pairs:
+            output_file.write(_dumps(pair) + '\n')
+            q_len = len(pair['question'])
+            a_len = len(pair['answer'])
+            accum['count'] += 1
+            accum['q_sum'] += q_len
+            accum['a_sum'] += a_len
+            if accum['q_min'] is None or q_len < accum['q_min']:
+                accum['q_min'] = q_len
+            if q_len > accum['q_max']:
+                accum['q_max'] = q_len
+            if accum['a_min'] is None or a_len < accum['a_min']:
+                accum['a_min'] = a_len
+            if a_len > accum['a_max']:
+                accum['a_max'] = a_len
+
+        results.append({
+            'block_idx': block_idx,
+            'success': True,
+            'qa_count': len(processed_pairs)
+        })
+        return processed_pairs
+
+    def _log_success(self, block_idx: int, block: str,
+                     processed_pairs: List[Dict[str, Any]],
+                     success_count: int,
+                     success_file: Optional[Any]) -> int:
+        """Record successfully extracted Q&A pairs.
+
+        Success records bypass the logging framework and go straight to a
+        buffered JSONL file — human-readable reports can be generated from it
+        offline without paying per-record formatting in the hot loop.
+
+        Args:
+            block_idx: Index of the block being processed
+            block: Normalized block text
+            processed_pairs: Q&A pairs extracted from the block
+            success_count: Number of pairs recorded so far
+            success_file: Open success JSONL handle, or None if disabled
+
+        Returns:
+            Updated success count
+        """
+        self.logger.info("✅ Block %d: Extracted %d Q&A pairs", block_idx + 1, len(processed_pairs))
+        if success_file is not None:
+            # One record per block with the source text embedded once; the
+            # per-pair layout repeated the full block for every pair, so a
+            # block with ten pairs wrote its content ten times
+            record = {
+                'block_idx': block_idx + 1,
+                'first_pair_idx': success_count + 1,
+                'pair_count': len(processed_pairs),
+                'source_block': block,
+                'pairs': [
+                    {'question': p['question'], 'answer': p['answer']}
+                    for p in processed_pairs
+                ]
+            }
+            success_file.write(_dumps(record) + '\n')
+
+        return success_count + len(processed_pairs)
+
     def _get_output_path(self) -> str:
         """Get the full output file path."""
         if os.path.isabs(self.config.output_filename):
@@ -250,26 +463,20 @@ class QAExtractionProcessor:
         successful_blocks = sum(1 for r in results if r['success'])
         total_qa_pairs = sum(r['qa_count'] for r in results)
         
-        # Calculate quality metrics if we have successful extractions
+        # Quality metrics come from the running accumulator maintained as
+        # pairs were written; the pairs themselves are long gone by now
         quality_metrics = {}
-        if successful_blocks > 0:
-            all_qa_pairs = []
-            for r in results:
-                if r['success'] and 'qa_pairs' in r:
-                    all_qa_pairs.extend(r['qa_pairs'])
-            
-            if all_qa_pairs:
-                question_lengths = [len(pair['question']) for pair in all_qa_pairs]
-                answer_lengths = [len(pair['answer']) for pair in all_qa_pairs]
-                
-                quality_metrics = {
-                    'avg_question_length': sum(question_lengths) / len(question_lengths),
-                    'avg_answer_length': sum(answer_lengths) / len(answer_lengths),
-                    'min_question_length': min(question_lengths),
-                    'max_question_length': max(question_lengths),
-                    'min_answer_length': min(answer_lengths),
-                    'max_answer_length': max(answer_lengths)
-                }
+        accum = getattr(self, '_stats_accum', None)
+        if accum and accum['count'] > 0:
+            pair_count = accum['count']
+            quality_metrics = {
+                'avg_question_length': accum['q_sum'] / pair_count,
+                'avg_answer_length': accum['a_sum'] / pair_count,
+                'min_question_length': accum['q_min'],
+                'max_question_length': accum['q_max'],
+                'min_answer_length': accum['a_min'],
+                'max_answer_length': accum['a_max']
+            }
         
         return {
             'total_blocks': total_blocks,
@@ -6,19 +6,43 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Iterator
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json remains the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson emits UTF-8 without escaping, matching ensure_ascii=False output;
+# its JSONDecodeError subclasses json.JSONDecodeError so except clauses
+# cover both parsers
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_line(item: Dict[str, Any]) -> str:
+    """Serialize one JSONL record including the trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(item).decode('utf-8') + '\n'
+    return json.dumps(item, ensure_ascii=False) + '\n'
+
+
+# Directories already created this process; repeat calls (one per saved
+# item on the append paths) skip the mkdir syscall entirely
+_ensured_dirs: set = set()
+
 
 def ensure_dir(path: str) -> str:
     """Ensure directory exists, create if it doesn't.
-    
+
     Args:
         path: Directory path
-        
+
     Returns:
         The directory path
     """
-    Path(path).mkdir(parents=True, exist_ok=True)
+    if path not in _ensured_dirs:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
     return path
 
 
@@ -38,7 +62,7 @@ def save_jsonl(data: List[Dict[str, Any]], file_path: str, append: bool = False)
     try:
         with open(file_path, mode, encoding='utf-8') as f:
             for item in data:
-                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+                f.write(_dumps_line(item))
         
         action = "Appended" if append else "Saved"
         logger.info(f"{action} {len(data)} items to {file_path}")
@@ -60,7 +84,7 @@ def save_single_jsonl_item(item: Dict[str, Any], file_path: str) -> None:
     
     try:
         with open(file_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+            f.write(_dumps_line(item))
     except Exception as e:
         logger.error(f"Failed to save item to {file_path}: {e}")
         raise
@@ -81,12 +105,15 @@ def load_jsonl(file_path: str) -> List[Dict[str, Any]]:
     
     data = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # Binary mode hands raw UTF-8 lines straight to the parser (both
+        # orjson and stdlib json accept bytes), skipping a full decode of
+        # the file just to re-encode it inside the parser
+        with open(file_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if line:
                     try:
-                        item = json.loads(line)
+                        item = _loads(line)
                         data.append(item)
                     except json.JSONDecodeError as e:
                         logger.warning(f"Failed to parse line {line_num} in {file_path}: {e}")
@@ -114,12 +141,14 @@ def iter_jsonl(file_path: str) -> Iterator[Dict[str, Any]]:
         return
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # Same binary fast path as load_jsonl: the parser consumes the raw
+        # UTF-8 bytes directly, so no intermediate str copy is made per line
+        with open(file_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if line:
                     try:
-                        yield json.loads(line)
+                        yield _loads(line)
                     except json.JSONDecodeError as e:
                         logger.warning(f"Failed to parse line {line_num} in {file_path}: {e}")
                         continue
@@ -153,10 +182,20 @@ def count_jsonl_lines(file_path: str) -> int:
     """
     if not os.path.exists(file_path):
         return 0
-    
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return sum(1 for line in f if line.strip())
+        # Counting raw newline bytes in binary chunks skips UTF-8 decoding
+        # and per-line iteration entirely; the writers in this module emit
+        # exactly one '\n' per record, so the counts agree
+        total = 0
+        last_byte = b''
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                total += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+        if last_byte and last_byte != b'\n':
+            total += 1  # Unterminated final line
+        return total
     except Exception as e:
         logger.error(f"Failed to count lines in {file_path}: {e}")
         return 0
@@ -1,7 +1,10 @@
 """Logging utilities for Legend QA Extractor."""
 
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
@@ -54,38 +57,58 @@ def setup_logger(name: str,
     return logger
 
 
-def setup_specialized_logger(name: str, 
+def _stop_queue_listener(listener: QueueListener) -> None:
+    """Stop a queue listener, tolerating repeated calls."""
+    if listener._thread is not None:
+        listener.stop()
+
+
+def setup_specialized_logger(name: str,
                            log_file: str,
                            log_format: str,
                            log_level: str = "INFO") -> logging.Logger:
     """Set up a specialized logger for specific purposes (e.g., error logs, success logs).
-    
+
+    Records are handed off through a queue to a background listener thread
+    that owns the file handler, so a call like .error() only enqueues the
+    record and never blocks the caller on formatting or disk I/O. The
+    listener is stopped (flushing the queue) at interpreter exit.
+
     Args:
         name: Logger name
         log_file: Path to log file
         log_format: Log format string
         log_level: Logging level
-        
+
     Returns:
         Configured specialized logger
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Clear existing handlers
+
+    # Clear existing handlers, stopping any listener from a previous setup
     logger.handlers.clear()
-    
+    previous = getattr(logger, '_queue_listener', None)
+    if previous is not None:
+        _stop_queue_listener(previous)
+
     # Ensure directory exists
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-    
-    # File handler
+
+    # File handler, driven by the listener thread rather than the caller
     file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
     file_handler.setFormatter(logging.Formatter(log_format))
-    logger.addHandler(file_handler)
-    
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    logger._queue_listener = listener
+    atexit.register(_stop_queue_listener, listener)
+
     # Prevent propagation to avoid duplicate logs
     logger.propagate = False
-    
+
     return logger
 
 
@@ -101,32 +124,28 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def setup_extraction_loggers(output_dir: str) -> tuple[logging.Logger, logging.Logger]:
-    """Set up specialized loggers for extraction process.
-    
+def setup_extraction_loggers(output_dir: str) -> logging.Logger:
+    """Set up the specialized error logger for the extraction process.
+
+    Successful extractions are no longer routed through the logging
+    framework: they are written directly to a buffered JSONL file by the
+    processor, which avoids per-record formatter/handler overhead on the
+    high-volume success path. Errors are rare and stay on logging.
+
     Args:
         output_dir: Directory for log files
-        
+
     Returns:
-        Tuple of (error_logger, success_logger)
+        Error logger instance
     """
     error_log_path = os.path.join(output_dir, "extraction_errors.log")
-    success_log_path = os.path.join(output_dir, "extraction_success.log")
-    
+
     # Error logger
     error_format = '%(asctime)s - %(levelname)s - BLOCK_START\n%(message)s\nBLOCK_END'
     error_logger = setup_specialized_logger(
-        'error_logger', 
-        error_log_path, 
+        'error_logger',
+        error_log_path,
         error_format
     )
-    
-    # Success logger
-    success_format = '%(asctime)s - %(levelname)s - QA_PAIR_START\n%(message)s\nQA_PAIR_END'
-    success_logger = setup_specialized_logger(
-        'success_logger', 
-        success_log_path, 
-        success_format
-    )
-    
-    return error_logger, success_logger 
\ No newline at end of file
+
+    return error_logger 
\ No newline at end of file
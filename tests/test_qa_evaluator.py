@@ -0,0 +1,137 @@
+"""Tests for Q&A evaluation module."""
+
+import pytest
+
+# numpy ships with the optional eval extra, not the dev install; skip the
+# evaluator tests instead of failing collection when it is absent
+np = pytest.importorskip("numpy")
+
+from src.core.qa_evaluator import QAEvaluator
+
+
+class StubEmbeddingModel:
+    """Deterministic embedding model for testing."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.encode_calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.encode_calls += 1
+        return np.array([self.vectors[text] for text in texts], dtype=np.float32)
+
+
+VECTORS = {
+    "什么是投资？": [1.0, 0.0, 0.0],
+    "投资是什么？": [0.99, 0.141, 0.0],
+    "如何做企业？": [0.0, 1.0, 0.0],
+    "完全无关的问题": [0.0, 0.0, 1.0],
+    "买股票就是买公司。": [0.0, 1.0, 0.0],
+    "买股票就是买公司的一部分。": [0.0, 0.98, 0.199],
+}
+
+
+class TestQAEvaluator:
+    """Test cases for QAEvaluator class."""
+
+    def _make_evaluator(self, golden, generated):
+        return QAEvaluator(golden, generated, embedding_model=StubEmbeddingModel(VECTORS))
+
+    def test_evaluate_matching_pairs(self):
+        """Test evaluation with a close question match."""
+        golden = [{"question": "什么是投资？", "answer": "买股票就是买公司。"}]
+        generated = [
+            {"question": "投资是什么？", "answer": "买股票就是买公司的一部分。"},
+            {"question": "完全无关的问题", "answer": "买股票就是买公司。"},
+        ]
+
+        evaluator = self._make_evaluator(golden, generated)
+        results = evaluator.evaluate_qa_extraction(similarity_threshold=0.7)
+
+        assert results['golden_count'] == 1
+        assert results['generated_count'] == 2
+        assert results['matched_count'] == 1
+        assert results['match_rate'] == 1.0
+        assert results['avg_question_similarity'] > 0.9
+        assert results['avg_answer_similarity'] > 0.9
+
+        match = results['detailed_matches'][0]
+        assert match['matched_question'] == "投资是什么？"
+        assert match['is_match'] is True
+
+        # All questions and answers are embedded in a single batched call
+        assert evaluator.embedding_model.encode_calls == 1
+
+    def test_evaluate_no_match_below_threshold(self):
+        """Test that dissimilar questions are not matched."""
+        golden = [{"question": "什么是投资？", "answer": "买股票就是买公司。"}]
+        generated = [{"question": "完全无关的问题", "answer": "买股票就是买公司。"}]
+
+        evaluator = self._make_evaluator(golden, generated)
+        results = evaluator.evaluate_qa_extraction(similarity_threshold=0.7)
+
+        assert results['matched_count'] == 0
+        assert results['match_rate'] == 0.0
+        assert results['detailed_matches'][0]['is_match'] is False
+        assert results['detailed_matches'][0]['answer_similarity'] == 0.0
+
+    def test_evaluate_empty_sets(self):
+        """Test evaluation with empty golden or generated sets."""
+        evaluator = self._make_evaluator([], [])
+        results = evaluator.evaluate_qa_extraction()
+
+        assert results['golden_count'] == 0
+        assert results['matched_count'] == 0
+        assert results['match_rate'] == 0.0
+        assert results['detailed_matches'] == []
+
+    def test_embedding_cache_reused(self):
+        """Test that on-disk embedding cache avoids re-encoding."""
+        import tempfile
+
+        golden = [{"question": "什么是投资？", "answer": "买股票就是买公司。"}]
+        generated = [{"question": "投资是什么？", "answer": "买股票就是买公司的一部分。"}]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            stub = StubEmbeddingModel(VECTORS)
+            evaluator = QAEvaluator(golden, generated, embedding_model=stub, cache_dir=cache_dir)
+
+            first = evaluator.evaluate_qa_extraction()
+            second = evaluator.evaluate_qa_extraction()
+
+            assert stub.encode_calls == 1
+            assert first == second
+
+    def test_load_qa_pairs_filters_invalid(self):
+        """Test that malformed items are dropped on load."""
+        import json
+        import tempfile
+
+        items = [
+            {"question": "什么是投资？", "answer": "买股票就是买公司。"},
+            {"question": "", "answer": "缺少问题"},
+            {"question": "缺少答案"},
+            "not a dict",
+        ]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+            file_path = f.name
+
+        try:
+            pairs = QAEvaluator.load_qa_pairs(file_path)
+            assert pairs == [{"question": "什么是投资？", "answer": "买股票就是买公司。"}]
+        finally:
+            import os
+            os.unlink(file_path)
+
+    def test_calculate_answer_similarity(self):
+        """Test pairwise answer similarity."""
+        evaluator = self._make_evaluator([], [])
+
+        same = evaluator.calculate_answer_similarity("如何做企业？", "买股票就是买公司。")
+        different = evaluator.calculate_answer_similarity("什么是投资？", "完全无关的问题")
+
+        assert same == pytest.approx(1.0)
+        assert different == pytest.approx(0.0)
@@ -0,0 +1,88 @@
+"""Tests for Q&A extraction module."""
+
+import pytest
+from src.core.qa_extractor import QAExtractor
+
+
+class TestQAExtractor:
+    """Test cases for QAExtractor class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.extractor = QAExtractor()
+
+    def test_extract_json_fenced_block(self):
+        """Test extraction from a ```json``` fenced response."""
+        response = (
+            "以下是提取结果：\n"
+            "```json\n"
+            '[{"question": "什么是投资？", "answer": "买股票就是买公司。"}]\n'
+            "```"
+        )
+        pairs = self.extractor.extract_json(response)
+
+        assert pairs == [{"question": "什么是投资？", "answer": "买股票就是买公司。"}]
+
+    def test_extract_json_bare_array(self):
+        """Test extraction from a bare JSON array response."""
+        response = (
+            '[{"question": "问题一", "answer": "回答一"}, '
+            '{"question": "问题二", "answer": "回答二"}]'
+        )
+        pairs = self.extractor.extract_json(response)
+
+        assert len(pairs) == 2
+        assert pairs[0]["question"] == "问题一"
+
+    def test_extract_json_embedded_objects(self):
+        """Test fallback extraction of JSON objects embedded in prose."""
+        response = (
+            '提取到两个问答对：{"question": "问题一", "answer": "回答一"} '
+            '还有 {"question": "问题二", "answer": "回答二"} 就这些。'
+        )
+        pairs = self.extractor.extract_json(response)
+
+        assert len(pairs) == 2
+        assert pairs[1]["answer"] == "回答二"
+
+    def test_extract_json_filters_invalid_pairs(self):
+        """Test that incomplete Q&A pairs are filtered out."""
+        response = (
+            '[{"question": "有效问题", "answer": "有效回答"}, '
+            '{"question": "", "answer": "缺少问题"}, '
+            '{"question": "缺少回答"}]'
+        )
+        pairs = self.extractor.extract_json(response)
+
+        assert pairs == [{"question": "有效问题", "answer": "有效回答"}]
+
+    def test_extract_json_no_json(self):
+        """Test response without any JSON content."""
+        assert self.extractor.extract_json("没有任何JSON内容的回复") == []
+
+    def test_create_prompt(self):
+        """Test prompt creation includes base prompt and text."""
+        prompt = self.extractor.create_prompt("测试文本")
+
+        assert prompt.endswith("测试文本")
+        assert "问答对" in prompt
+
+    def test_validate_extraction_quality(self):
+        """Test extraction quality metrics."""
+        qa_pairs = [
+            {"question": "什么是价值投资？", "answer": "价值投资就是买入低估的好公司并长期持有。"},
+            {"question": "如何看待风险？", "answer": "不懂的东西不碰，这是最重要的风险控制。"},
+        ]
+        metrics = self.extractor.validate_extraction_quality("原文", qa_pairs)
+
+        assert metrics['total_pairs'] == 2
+        assert metrics['avg_question_length'] > 5
+        assert metrics['has_duplicates'] is False
+        assert metrics['quality_score'] == 1.0
+
+    def test_validate_extraction_quality_empty(self):
+        """Test quality metrics with no pairs."""
+        metrics = self.extractor.validate_extraction_quality("原文", [])
+
+        assert metrics['total_pairs'] == 0
+        assert metrics['quality_score'] == 0.0
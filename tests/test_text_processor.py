@@ -7,9 +7,14 @@ from src.core.text_processor import TextProcessor
 class TestTextProcessor:
     """Test cases for TextProcessor class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.processor = TextProcessor()
+    @classmethod
+    def setup_class(cls):
+        """Set up shared test fixtures.
+
+        TextProcessor is stateless after construction, so one instance
+        (and one compilation of its prefix patterns) serves every test.
+        """
+        cls.processor = TextProcessor()
     
     def test_preprocess_qa_text(self):
         """Test Q&A text preprocessing."""
@@ -33,7 +38,23 @@ class TestTextProcessor:
         for input_text, expected in test_cases:
             result = self.processor.clean_question_text(input_text)
             assert result == expected, f"Failed for input: {input_text}"
-    
+
+    def test_clean_question_texts_batch(self):
+        """Test batch question cleaning matches the per-item results."""
+        questions = [
+            "网友：什么是投资？",
+            "网友：",
+            "问：如何学习？",
+            "问： ",
+            "已经清洁的问题",
+            "",
+            None,
+        ]
+
+        expected = [self.processor.clean_question_text(q) for q in questions]
+        assert self.processor.clean_question_texts(questions) == expected
+        assert self.processor.clean_question_texts([]) == []
+
     def test_create_hybrid_blocks_basic(self):
         """Test basic block creation."""
         text = "段落1\n\n段落2\n\n段落3"
@@ -81,6 +102,23 @@ class TestTextProcessor:
         for text in negative_cases:
             assert not self.processor.block_has_qa(text), f"Failed for: {text}"
     
+    def test_classify_and_preprocess(self):
+        """Test fused Q&A classification and normalization."""
+        has_qa, normalized = self.processor.classify_and_preprocess(
+            "网友:这是测试\n段永平:这是回答\n\n\n额外空行"
+        )
+        assert has_qa
+        assert normalized == "网友：这是测试\n段永平：这是回答\n\n额外空行"
+
+        # Classification matches block_has_qa
+        has_qa, _ = self.processor.classify_and_preprocess("只是普通文本")
+        assert not has_qa
+        has_qa, _ = self.processor.classify_and_preprocess("有人认为投资很难\n段永平：确实不容易")
+        assert has_qa
+
+        # Empty input
+        assert self.processor.classify_and_preprocess("") == (False, "")
+
     def test_filter_blocks_by_ratio(self):
         """Test block filtering by ratio."""
         blocks = [f"Block {i}" for i in range(10)]